@@ -371,18 +371,15 @@ class _PresubmitResult(object):
     raise ValueError("Unknown string type %s" % type(val))
 
   def handle(self):
-    sys.stdout.write(self._message)
-    sys.stdout.write('\n')
+    # Build the whole result and write it at once; message and long_text are
+    # already str (see _ensure_str) and items are converted with str().
+    output = [self._message, '\n']
     for item in self._items:
-      sys.stdout.write('  ')
-      # Write separately in case it's unicode.
-      sys.stdout.write(str(item))
-      sys.stdout.write('\n')
+      output.extend(('  ', str(item), '\n'))
     if self._long_text:
-      sys.stdout.write('\n***************\n')
-      # Write separately in case it's unicode.
-      sys.stdout.write(self._long_text)
-      sys.stdout.write('\n***************\n')
+      output.extend(('\n***************\n', self._long_text,
+                     '\n***************\n'))
+    sys.stdout.write(''.join(output))
 
   def json_format(self):
     return {
@@ -920,6 +917,10 @@ class _DiffCache(object):
 
 class _GitDiffCache(_DiffCache):
   """DiffCache implementation for git; gets all file diffs at once."""
+  # This regex matches the path twice, separated by a space. Note that
+  # filename itself may contain spaces.
+  _FILE_MARKER = re.compile('^diff --git (?P<filename>.*) (?P=filename)$')
+
   def __init__(self, upstream):
     super(_GitDiffCache, self).__init__(upstream=upstream)
     self._diffs_by_file = None
@@ -937,20 +938,18 @@ class _GitDiffCache(_DiffCache):
       unified_diff = scm.GIT.GenerateDiff(local_root, files=[], full_move=True,
                                           branch=self._upstream)
 
-      # This regex matches the path twice, separated by a space. Note that
-      # filename itself may contain spaces.
-      file_marker = re.compile('^diff --git (?P<filename>.*) (?P=filename)$')
       current_diff = []
       keep_line_endings = True
       for x in unified_diff.splitlines(keep_line_endings):
-        match = file_marker.match(x)
-        if match:
-          # Marks the start of a new per-file section.
-          diffs[match.group('filename')] = current_diff = [x]
-        elif x.startswith('diff --git'):
-          raise PresubmitFailure('Unexpected diff line: %s' % x)
-        else:
+        # Only file headers need the regex; skip it for all other lines.
+        if not x.startswith('diff --git'):
           current_diff.append(x)
+          continue
+        match = self._FILE_MARKER.match(x)
+        if not match:
+          raise PresubmitFailure('Unexpected diff line: %s' % x)
+        # Marks the start of a new per-file section.
+        diffs[match.group('filename')] = current_diff = [x]
 
       self._diffs_by_file = dict(
         (normpath(path), ''.join(diff)) for path, diff in diffs.items())
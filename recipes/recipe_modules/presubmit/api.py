@@ -20,10 +20,13 @@ class PresubmitApi(recipe_api.RecipeApi):
 
     self._runhooks = properties.runhooks
     self._timeout_s = properties.timeout_s or _DEFAULT_TIMEOUT_S
+    self._presubmit_support_path = None
 
   @property
   def presubmit_support_path(self):
-    return self.repo_resource('presubmit_support.py')
+    if self._presubmit_support_path is None:
+      self._presubmit_support_path = self.repo_resource('presubmit_support.py')
+    return self._presubmit_support_path
 
   def __call__(self, *args, **kwargs):
     """Returns a presubmit step."""
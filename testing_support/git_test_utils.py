@@ -282,6 +282,10 @@ class GitRepo(object):
 
   COMMAND_OUTPUT = collections.namedtuple('COMMAND_OUTPUT', 'retcode stdout')
 
+  # Test commits never need hooks or signing; skipping them keeps user config
+  # (e.g. commit.gpgsign) from slowing down or breaking repo creation.
+  COMMIT_FLAGS = ('--no-verify', '--no-gpg-sign', '-q')
+
   def __init__(self, schema):
     """Makes new GitRepo.
 
@@ -356,7 +360,8 @@ class GitRepo(object):
 
       self.git('add', fname)
 
-    rslt = self.git('commit', '--allow-empty', '-m', commit.name, env=env)
+    rslt = self.git('commit', '--allow-empty', '-m', commit.name,
+                    *self.COMMIT_FLAGS, env=env)
     assert rslt.retcode == 0, 'Failed to commit %s' % str(commit)
     self.commit_map[commit.name] = self.git('rev-parse', 'HEAD').stdout.strip()
     self.git('tag', 'tag_%s' % commit.name, self[commit.name])
@@ -405,7 +410,8 @@ class GitRepo(object):
                     self[commit_name]).stdout
 
   def git_commit(self, message):
-    return self.git('commit', '-am', message, env=self.get_git_commit_env())
+    return self.git('commit', '-am', message, *self.COMMIT_FLAGS,
+                    env=self.get_git_commit_env())
 
   def nuke(self):
     """Obliterates the git repo on disk.
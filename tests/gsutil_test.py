@@ -9,6 +9,7 @@ from __future__ import unicode_literals
 
 
 import base64
+import collections
 import hashlib
 import io
 import json
@@ -25,6 +26,8 @@ try:
 except ImportError:  # For Py3 compatibility
   import urllib.request as urllib
 
+from unittest import mock
+
 # Add depot_tools to path
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 DEPOT_TOOLS_DIR = os.path.dirname(THIS_DIR)
@@ -37,9 +40,30 @@ class TestError(Exception):
   pass
 
 
+def _b64_md5(data):
+  """Returns the md5Hash metadata value gsutil.py expects for |data|."""
+  return base64.b64encode(
+      hashlib.md5(data).hexdigest().encode('utf-8')).decode('utf-8')
+
+
+def _make_gsutil_zip(content):
+  buf = io.BytesIO()
+  with zipfile.ZipFile(buf, 'w') as zf:
+    zf.writestr('gsutil/gsutil', content)
+  return buf.getvalue()
+
+
+FAKE_FILE = b'This is gsutil.zip'
+FAKE_FILE_MD5 = _b64_md5(FAKE_FILE)
+FAKE_FILE2 = b'This is other gsutil.zip'
+BAD_MD5 = base64.b64encode(b'aaaaaaa').decode('utf-8')
+FAKE_GSUTIL = 'Fake gsutil'
+FAKE_GSUTIL_ZIP = _make_gsutil_zip(FAKE_GSUTIL)
+
+
 class FakeCall(object):
   def __init__(self):
-    self.expectations = []
+    self.expectations = collections.deque()
 
   def add_expectation(self, *args, **kwargs):
     returns = kwargs.pop('_returns', None)
@@ -48,7 +72,7 @@ class FakeCall(object):
   def __call__(self, *args, **kwargs):
     if not self.expectations:
       raise TestError('Got unexpected\n%s\n%s' % (args, kwargs))
-    exp_args, exp_kwargs, exp_returns = self.expectations.pop(0)
+    exp_args, exp_kwargs, exp_returns = self.expectations.popleft()
     if args != exp_args or kwargs != exp_kwargs:
       message = 'Expected:\n  args: %s\n  kwargs: %s\n' % (exp_args, exp_kwargs)
       message += 'Got:\n  args: %s\n  kwargs: %s\n' % (args, kwargs)
@@ -60,57 +84,65 @@ class GsutilUnitTests(unittest.TestCase):
   def setUp(self):
     self.fake = FakeCall()
     self.tempdir = tempfile.mkdtemp()
-    self.old_urlopen = getattr(urllib, 'urlopen')
-    self.old_call = getattr(subprocess, 'call')
-    setattr(urllib, 'urlopen', self.fake)
-    setattr(subprocess, 'call', self.fake)
+    mock.patch.object(urllib, 'urlopen', self.fake).start()
+    mock.patch.object(subprocess, 'call', self.fake).start()
+    self.addCleanup(mock.patch.stopall)
 
   def tearDown(self):
-    self.assertEqual(self.fake.expectations, [])
+    self.assertFalse(
+        self.fake.expectations,
+        'Unconsumed expectations: %r' % list(self.fake.expectations))
     shutil.rmtree(self.tempdir)
-    setattr(urllib, 'urlopen', self.old_urlopen)
-    setattr(subprocess, 'call', self.old_call)
+
+  def _write_gsutil_zip(self, filename, content):
+    with open(os.path.join(self.tempdir, filename), 'wb') as f:
+      f.write(content)
 
   def test_download_gsutil(self):
     version = gsutil.VERSION
     filename = 'gsutil_%s.zip' % version
     full_filename = os.path.join(self.tempdir, filename)
-    fake_file = b'This is gsutil.zip'
-    fake_file2 = b'This is other gsutil.zip'
     url = '%s%s' % (gsutil.GSUTIL_URL, filename)
-    self.fake.add_expectation(url, _returns=io.BytesIO(fake_file))
+    self.fake.add_expectation(url, _returns=io.BytesIO(FAKE_FILE))
 
     self.assertEqual(
         gsutil.download_gsutil(version, self.tempdir), full_filename)
     with open(full_filename, 'rb') as f:
-      self.assertEqual(fake_file, f.read())
+      self.assertEqual(FAKE_FILE, f.read())
+
+  def test_download_gsutil_up_to_date(self):
+    version = gsutil.VERSION
+    filename = 'gsutil_%s.zip' % version
+    full_filename = os.path.join(self.tempdir, filename)
+    self._write_gsutil_zip(filename, FAKE_FILE)
 
     metadata_url = gsutil.API_URL + filename
-    md5_calc = hashlib.md5()
-    md5_calc.update(fake_file)
-    b64_md5 = base64.b64encode(md5_calc.hexdigest().encode('utf-8'))
     self.fake.add_expectation(
         metadata_url,
         _returns=io.BytesIO(
-            json.dumps({'md5Hash': b64_md5.decode('utf-8')}).encode('utf-8')))
+            json.dumps({'md5Hash': FAKE_FILE_MD5}).encode('utf-8')))
     self.assertEqual(
         gsutil.download_gsutil(version, self.tempdir), full_filename)
     with open(full_filename, 'rb') as f:
-      self.assertEqual(fake_file, f.read())
-    self.assertEqual(self.fake.expectations, [])
+      self.assertEqual(FAKE_FILE, f.read())
 
+  def test_download_gsutil_bad_md5(self):
+    version = gsutil.VERSION
+    filename = 'gsutil_%s.zip' % version
+    full_filename = os.path.join(self.tempdir, filename)
+    url = '%s%s' % (gsutil.GSUTIL_URL, filename)
+    self._write_gsutil_zip(filename, FAKE_FILE)
+
+    metadata_url = gsutil.API_URL + filename
     self.fake.add_expectation(
         metadata_url,
         _returns=io.BytesIO(
-            json.dumps({
-              'md5Hash': base64.b64encode(b'aaaaaaa').decode('utf-8')  # Bad MD5
-            }).encode('utf-8')))
-    self.fake.add_expectation(url, _returns=io.BytesIO(fake_file2))
+            json.dumps({'md5Hash': BAD_MD5}).encode('utf-8')))
+    self.fake.add_expectation(url, _returns=io.BytesIO(FAKE_FILE2))
     self.assertEqual(
         gsutil.download_gsutil(version, self.tempdir), full_filename)
     with open(full_filename, 'rb') as f:
-      self.assertEqual(fake_file2, f.read())
-    self.assertEqual(self.fake.expectations, [])
+      self.assertEqual(FAKE_FILE2, f.read())
 
   def test_ensure_gsutil_full(self):
     version = gsutil.VERSION
@@ -121,20 +153,15 @@ class GsutilUnitTests(unittest.TestCase):
 
     zip_filename = 'gsutil_%s.zip' % version
     url = '%s%s' % (gsutil.GSUTIL_URL, zip_filename)
-    _, tempzip = tempfile.mkstemp()
-    fake_gsutil = 'Fake gsutil'
-    with zipfile.ZipFile(tempzip, 'w') as zf:
-      zf.writestr('gsutil/gsutil', fake_gsutil)
-    with open(tempzip, 'rb') as f:
-      self.fake.add_expectation(url, _returns=io.BytesIO(f.read()))
+    self.fake.add_expectation(url, _returns=io.BytesIO(FAKE_GSUTIL_ZIP))
 
     # This should write the gsutil_bin with 'Fake gsutil'
     gsutil.ensure_gsutil(version, self.tempdir, False)
     self.assertTrue(os.path.exists(gsutil_bin))
     with open(gsutil_bin, 'r') as f:
-      self.assertEqual(f.read(), fake_gsutil)
+      self.assertEqual(f.read(), FAKE_GSUTIL)
     self.assertTrue(os.path.exists(gsutil_flag))
-    self.assertEqual(self.fake.expectations, [])
+    self.assertFalse(self.fake.expectations)
 
   def test_ensure_gsutil_short(self):
     version = gsutil.VERSION
@@ -7,18 +7,13 @@ import os
 import sys
 import unittest
 
-if sys.version_info.major == 2:
-  import mock
-else:
-  from unittest import mock
+from unittest import mock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import gerrit_util
 import owners_client
 
-from testing_support import filesystem_mock
-
 
 alice = 'alice@example.com'
 bob = 'bob@example.com'
@@ -9,15 +9,10 @@ import os
 import sys
 import unittest
 
-if sys.version_info.major == 2:
-  import mock
-else:
-  from unittest import mock
+from unittest import mock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from testing_support import filesystem_mock
-
 import owners_finder
 import owners_client
 
@@ -33,17 +28,6 @@ tom = 'tom@example.com'
 nonowner = 'nonowner@example.com'
 
 
-
-
-def owners_file(*email_addresses, **kwargs):
-  s = ''
-  if kwargs.get('comment'):
-    s += '# %s\n' % kwargs.get('comment')
-  if kwargs.get('noparent'):
-    s += 'set noparent\n'
-  return s + '\n'.join(email_addresses) + '\n'
-
-
 class TestClient(owners_client.OwnersClient):
   def __init__(self):
     super(TestClient, self).__init__()
@@ -107,6 +91,18 @@ class _BaseTestCase(unittest.TestCase):
     'content/baz/ugly.h',
     'content/views/pie.h'
   ]
+  default_unreviewed_files = frozenset([
+    'base/vlog.h',
+    'chrome/browser/defaults.h',
+    'chrome/gpu/gpu_channel.h',
+    'chrome/renderer/gpu/gpu_channel_host.h',
+    'chrome/renderer/safe_browsing/scorer.h',
+    'content/content.gyp',
+    'content/bar/foo.cc',
+    'content/baz/ugly.cc',
+    'content/baz/ugly.h',
+  ])
+  default_owners_queue = [brett, darin, john, peter, ken, ben, tom]
 
   def ownersFinder(self, files, author=nonowner, reviewers=None):
     reviewers = reviewers or []
@@ -150,22 +146,11 @@ class OwnersFinderTests(_BaseTestCase):
 
   @mock.patch('owners_client.OwnersClient.ScoreOwners')
   def test_reset(self, mockScoreOwners):
-    mockScoreOwners.return_value = [brett, darin, john, peter, ken, ben, tom]
+    mockScoreOwners.return_value = self.default_owners_queue
     finder = self.defaultFinder()
     for _ in range(2):
-      expected = [brett, darin, john, peter, ken, ben, tom]
-      self.assertEqual(finder.owners_queue, expected)
-      self.assertEqual(finder.unreviewed_files, {
-          'base/vlog.h',
-          'chrome/browser/defaults.h',
-          'chrome/gpu/gpu_channel.h',
-          'chrome/renderer/gpu/gpu_channel_host.h',
-          'chrome/renderer/safe_browsing/scorer.h',
-          'content/content.gyp',
-          'content/bar/foo.cc',
-          'content/baz/ugly.cc',
-          'content/baz/ugly.h'
-      })
+      self.assertEqual(finder.owners_queue, self.default_owners_queue)
+      self.assertEqual(finder.unreviewed_files, self.default_unreviewed_files)
       self.assertEqual(finder.selected_owners, set())
       self.assertEqual(finder.deselected_owners, set())
       self.assertEqual(finder.reviewed_by, {})
@@ -177,7 +162,7 @@ class OwnersFinderTests(_BaseTestCase):
 
   @mock.patch('owners_client.OwnersClient.ScoreOwners')
   def test_select(self, mockScoreOwners):
-    mockScoreOwners.return_value = [brett, darin, john, peter, ken, ben, tom]
+    mockScoreOwners.return_value = self.default_owners_queue
     finder = self.defaultFinder()
     finder.select_owner(john)
     self.assertEqual(finder.owners_queue, [brett, peter, ken, ben, tom])
@@ -190,7 +175,8 @@ class OwnersFinderTests(_BaseTestCase):
     self.assertEqual(finder.output,
                      ['Selected: ' + john, 'Deselected: ' + darin])
 
-    finder = self.defaultFinder()
+    finder.reset()
+    finder.resetText()
     finder.select_owner(darin)
     self.assertEqual(finder.owners_queue, [brett, peter, ken, ben, tom])
     self.assertEqual(finder.selected_owners, {darin})
@@ -202,7 +188,8 @@ class OwnersFinderTests(_BaseTestCase):
     self.assertEqual(finder.output,
                      ['Selected: ' + darin, 'Deselected: ' + john])
 
-    finder = self.defaultFinder()
+    finder.reset()
+    finder.resetText()
     finder.select_owner(brett)
     expected = [darin, john, peter, ken, tom]
     self.assertEqual(finder.owners_queue, expected)
@@ -220,7 +207,7 @@ class OwnersFinderTests(_BaseTestCase):
 
   @mock.patch('owners_client.OwnersClient.ScoreOwners')
   def test_deselect(self, mockScoreOwners):
-    mockScoreOwners.return_value = [brett, darin, john, peter, ken, ben, tom]
+    mockScoreOwners.return_value = self.default_owners_queue
     finder = self.defaultFinder()
     finder.deselect_owner(john)
     self.assertEqual(finder.owners_queue, [brett, peter, ken, ben, tom])
@@ -246,14 +233,11 @@ class OwnersFinderTests(_BaseTestCase):
   def test_print_file_info_detailed(self):
     finder = self.defaultFinder()
     finder.print_file_info_detailed('chrome/browser/defaults.h')
-    self.assertEqual(finder.output,
-                     ['chrome/browser/defaults.h',
-                       [ben, brett, ken, peter, tom]])
-    finder.resetText()
-
     finder.print_file_info_detailed('chrome/renderer/gpu/gpu_channel_host.h')
     self.assertEqual(finder.output,
-                     ['chrome/renderer/gpu/gpu_channel_host.h',
+                     ['chrome/browser/defaults.h',
+                       [ben, brett, ken, peter, tom],
+                      'chrome/renderer/gpu/gpu_channel_host.h',
                        [ben, brett, ken, peter, tom]])
 
 
@@ -9,6 +9,7 @@
 
 from __future__ import unicode_literals
 
+import collections
 import functools
 import io
 import itertools
@@ -245,15 +246,15 @@ class PresubmitUnittest(PresubmitTestsBase):
         os.path.join(
             self.fake_root_dir, 'foo', 'haspresubmit', 'yodle', 'PRESUBMIT.py'),
     ]
-    os.path.isfile.side_effect = lambda f: f in known_files
+    os.path.isfile.side_effect = frozenset(known_files).__contains__
 
-    dirs_with_presubmit = [
-        self.fake_root_dir,
-        os.path.join(self.fake_root_dir, 'foo', 'haspresubmit'),
-        os.path.join(self.fake_root_dir, 'foo', 'haspresubmit', 'yodle'),
-    ]
-    os.listdir.side_effect = (
-        lambda d: ['PRESUBMIT.py'] if d in dirs_with_presubmit else [])
+    listdir_table = collections.defaultdict(list, {
+        d: ['PRESUBMIT.py'] for d in (
+            self.fake_root_dir,
+            os.path.join(self.fake_root_dir, 'foo', 'haspresubmit'),
+            os.path.join(self.fake_root_dir, 'foo', 'haspresubmit', 'yodle'),
+        )})
+    os.listdir.side_effect = listdir_table.__getitem__
 
     presubmit_files = presubmit.ListRelevantPresubmitFiles(
         files, self.fake_root_dir)
@@ -283,19 +284,19 @@ class PresubmitUnittest(PresubmitTestsBase):
         os.path.join('zoo', 'test3.cc')
     ]
 
-    known_files = [
+    known_files = frozenset([
         inherit_path,
         os.path.join(sys_root_dir, 'foo', 'PRESUBMIT.py'),
         os.path.join(sys_root_dir, 'foo', 'bar', 'moo', 'PRESUBMIT.py'),
-    ]
-    os.path.isfile.side_effect = lambda f: f in known_files
-
-    dirs_with_presubmit = [
-        os.path.join(sys_root_dir, 'foo'),
-        os.path.join(sys_root_dir, 'foo', 'bar','moo'),
-    ]
-    os.listdir.side_effect = (
-        lambda d: ['PRESUBMIT.py'] if d in dirs_with_presubmit else [])
+    ])
+    os.path.isfile.side_effect = known_files.__contains__
+
+    listdir_table = collections.defaultdict(list, {
+        d: ['PRESUBMIT.py'] for d in (
+            os.path.join(sys_root_dir, 'foo'),
+            os.path.join(sys_root_dir, 'foo', 'bar','moo'),
+        )})
+    os.listdir.side_effect = listdir_table.__getitem__
 
     presubmit_files = presubmit.ListRelevantPresubmitFiles(files, root_dir)
     self.assertEqual(presubmit_files, [
@@ -17,6 +17,22 @@ from testing_support import fake_repos
 ROLL_DEP = os.path.join(ROOT_DIR, 'roll-dep')
 GCLIENT = os.path.join(ROOT_DIR, 'gclient')
 
+DEPS_TEMPLATE = '\n'.join([
+    'deps = {',
+    ' "src/foo": "file:///%(git_base)srepo_2@%(repo_2_revision)s",',
+    '}',
+    'hooks = [',
+    '  {"action": ["foo", "--android", "{checkout_android}"]}',
+    ']',
+])
+
+
+def deps_content(git_base, repo_2_revision):
+  return DEPS_TEMPLATE % {
+      'git_base': git_base.replace('\\', '\\\\'),
+      'repo_2_revision': repo_2_revision,
+  }
+
 
 class FakeRepos(fake_repos.FakeReposBase):
   NB_GIT_REPOS = 2
@@ -32,20 +48,9 @@ class FakeRepos(fake_repos.FakeReposBase):
         'origin': 'git/repo_2@3',
     })
 
-    self._commit_git(
-        'repo_1', {
-            'DEPS': '\n'.join([
-                'deps = {',
-                ' "src/foo": "file:///%(git_base)srepo_2@%(repo_2_revision)s",',
-                '}',
-                'hooks = [',
-                '  {"action": ["foo", "--android", "{checkout_android}"]}',
-                ']',
-            ]) % {
-                'git_base': self.git_base.replace('\\', '\\\\'),
-                'repo_2_revision': self.git_hashes['repo_2'][1][0],
-            },
-        })
+    self._commit_git('repo_1', {
+        'DEPS': deps_content(self.git_base, self.git_hashes['repo_2'][1][0]),
+    })
 
 
 class RollDepTest(fake_repos.FakeReposTestBase):
@@ -72,16 +77,13 @@ class RollDepTest(fake_repos.FakeReposTestBase):
 
   def call(self, cmd, cwd=None):
     cwd = cwd or self.src_dir
-    process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE, env=self.env,
-                               shell=sys.platform.startswith('win'))
-    stdout, stderr = process.communicate()
-    logging.debug("XXX: %s\n%s\nXXX" % (' '.join(cmd), stdout))
-    logging.debug("YYY: %s\n%s\nYYY" % (' '.join(cmd), stderr))
-    stdout = stdout.decode('utf-8')
-    stderr = stderr.decode('utf-8')
-    return (stdout.replace('\r\n', '\n'), stderr.replace('\r\n', '\n'),
-            process.returncode)
+    # Text mode decodes the output and normalizes '\r\n' line endings.
+    process = subprocess.run(cmd, cwd=cwd, capture_output=True, env=self.env,
+                             shell=sys.platform.startswith('win'),
+                             encoding='utf-8')
+    logging.debug("XXX: %s\n%s\nXXX" % (' '.join(cmd), process.stdout))
+    logging.debug("YYY: %s\n%s\nYYY" % (' '.join(cmd), process.stderr))
+    return process.stdout, process.stderr, process.returncode
 
   def testRollsDep(self):
     if not self.enabled:
@@ -96,15 +98,9 @@ class RollDepTest(fake_repos.FakeReposTestBase):
       contents = f.read()
 
     self.assertEqual(self.gitrevparse(self.foo_dir), expected_revision)
-    self.assertEqual([
-        'deps = {',
-        ' "src/foo": "file:///' + self.git_base.replace('\\', '\\\\') +
-        'repo_2@' + expected_revision + '",',
-        '}',
-        'hooks = [',
-        '  {"action": ["foo", "--android", "{checkout_android}"]}',
-        ']',
-    ], contents.splitlines())
+    self.assertEqual(
+        deps_content(self.git_base, expected_revision).splitlines(),
+        contents.splitlines())
 
     commit_message = self.call(['git', 'log', '-n', '1'])[0]
 
@@ -144,15 +140,9 @@ class RollDepTest(fake_repos.FakeReposTestBase):
       contents = f.read()
 
     self.assertEqual(self.gitrevparse(self.foo_dir), expected_revision)
-    self.assertEqual([
-        'deps = {',
-        ' "src/foo": "file:///' + self.git_base.replace('\\', '\\\\') +
-        'repo_2@' + expected_revision + '",',
-        '}',
-        'hooks = [',
-        '  {"action": ["foo", "--android", "{checkout_android}"]}',
-        ']',
-    ], contents.splitlines())
+    self.assertEqual(
+        deps_content(self.git_base, expected_revision).splitlines(),
+        contents.splitlines())
 
     commit_message = self.call(['git', 'log', '-n', '1'])[0]
 
@@ -176,15 +166,9 @@ class RollDepTest(fake_repos.FakeReposTestBase):
       contents = f.read()
 
     self.assertEqual(self.gitrevparse(self.foo_dir), expected_revision)
-    self.assertEqual([
-        'deps = {',
-        ' "src/foo": "file:///' + self.git_base.replace('\\', '\\\\') +
-        'repo_2@' + expected_revision + '",',
-        '}',
-        'hooks = [',
-        '  {"action": ["foo", "--android", "{checkout_android}"]}',
-        ']',
-    ], contents.splitlines())
+    self.assertEqual(
+        deps_content(self.git_base, expected_revision).splitlines(),
+        contents.splitlines())
 
     commit_message = self.call(['git', 'log', '-n', '1'])[0]
 
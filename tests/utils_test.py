@@ -8,10 +8,7 @@ import os
 import sys
 import unittest
 
-if sys.version_info.major == 2:
-  import mock
-else:
-  from unittest import mock
+from unittest import mock
 
 DEPOT_TOOLS_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, DEPOT_TOOLS_ROOT)
@@ -38,7 +35,7 @@ class GitCacheTest(unittest.TestCase):
 
   @mock.patch('subprocess.check_output')
   @mock.patch('os.path.getmtime')
-  def testVersionWithNoGit(self, mock_subprocess, mock_getmtime):
+  def testVersionWithNoGitNoRecipesCfg(self, mock_getmtime, mock_subprocess):
     mock_subprocess.side_effect = Exception
     mock_getmtime.side_effect = Exception
     version = utils.depot_tools_version()